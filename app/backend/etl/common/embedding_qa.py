@@ -1,4 +1,4 @@
-import json
+import orjson
 from typing import Dict, List, Any, Callable
 from etl.common.embedding import create_embedding
 
@@ -52,8 +52,8 @@ def embedding_qa_json(
 ) -> Dict[str, Any]:
     """Process and embed QA data from JSON text."""
     try:
-        root = json.loads(text)
-    except json.JSONDecodeError:
+        root = orjson.loads(text)
+    except orjson.JSONDecodeError:
         print("Failed to parse JSON, returning default empty object")
         return {"Groups": [{"Summary": "", "PossibleQA": []}]}
 
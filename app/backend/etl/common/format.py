@@ -2,6 +2,13 @@ import json
 import re
 from typing import Dict, List, Optional, Union
 
+# Compiled once at import; these run on every LLM generation result
+JSON_PATTERN = re.compile(r"```json(.*?)```", re.DOTALL)
+SUMMARY_PATTERN = re.compile(r'"Summary":\s*"([^"]*)"')
+QUESTION_PATTERN = re.compile(r'"Question":\s*"([^"]*)"')
+ANSWER_PATTERN = re.compile(r'"Answer":\s*"([^"]*)"')
+MARKDOWN_PATTERN = re.compile(r"```markdown\s*(.*?)\s*```", re.DOTALL)
+
 
 def extract_qa_object(text: str) -> Dict[str, Union[str, List[Dict[str, str]]]]:
     """
@@ -45,8 +52,7 @@ def extract_json_content(text: str) -> str:
     Returns:
         Extracted JSON content or original text if no JSON block found
     """
-    JSON_PATTERN = r"```json(.*?)```"
-    match = re.search(JSON_PATTERN, text, re.DOTALL)
+    match = JSON_PATTERN.search(text)
     return match.group(1) if match else text
 
 
@@ -62,15 +68,10 @@ def extract_json_manually(
     Returns:
         Dictionary containing Summary and PossibleQA list, or None if extraction fails
     """
-    # Define regex patterns
-    SUMMARY_PATTERN = r'"Summary":\s*"([^"]*)"'
-    QUESTION_PATTERN = r'"Question":\s*"([^"]*)"'
-    ANSWER_PATTERN = r'"Answer":\s*"([^"]*)"'
-
     # Extract content using patterns
-    summary_match = re.search(SUMMARY_PATTERN, text)
-    questions = re.findall(QUESTION_PATTERN, text)
-    answers = re.findall(ANSWER_PATTERN, text)
+    summary_match = SUMMARY_PATTERN.search(text)
+    questions = QUESTION_PATTERN.findall(text)
+    answers = ANSWER_PATTERN.findall(text)
 
     # Validate and construct result
     if not (summary_match and questions and answers and len(questions) == len(answers)):
@@ -96,6 +97,5 @@ def extract_markdown_content(text: str) -> str:
     Returns:
         Extracted markdown content or original text if no markdown block found
     """
-    MARKDOWN_PATTERN = r"```markdown\s*(.*?)\s*```"
-    matches = re.findall(MARKDOWN_PATTERN, text, re.DOTALL)
+    matches = MARKDOWN_PATTERN.findall(text)
     return "\n".join(matches).strip() if matches else text.strip()
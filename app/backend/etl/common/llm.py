@@ -1,9 +1,17 @@
+from functools import lru_cache
+
 from openai import OpenAI
 from etl.common.config import app_config
 from etl.common.rate_limiter import RateLimiter
 from typing import List, Dict
 
 
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: str, api_base: str) -> OpenAI:
+    """Share one OpenAI client (and its HTTP connection pool) per endpoint."""
+    return OpenAI(api_key=api_key, base_url=api_base)
+
+
 class LLMClient:
     def __init__(
         self,
@@ -15,7 +23,7 @@ class LLMClient:
         temperature: float = 0.7,
         top_p: float = 0.7,
     ):
-        self.client = OpenAI(api_key=api_key, base_url=api_base)
+        self.client = _get_openai_client(api_key, api_base)
         self.model_name = model_name
         self.system_prompt = system_prompt
         self.temperature = temperature
@@ -14,10 +14,20 @@ class VectorConfig:
         dense_vector_size: int = 1024,
         dense_distance: Distance = Distance.COSINE,
         sparse_modifier: models.Modifier = models.Modifier.IDF,
+        quantization_config: Optional[models.ScalarQuantization] = None,
     ):
         self.dense_vector_size = dense_vector_size
         self.dense_distance = dense_distance
         self.sparse_modifier = sparse_modifier
+        # int8 scalar quantization keeps dense search memory-friendly on
+        # large collections; queries rescore with original vectors
+        self.quantization_config = quantization_config or models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
 
 
 class VectorClient:
@@ -74,6 +84,7 @@ class VectorClient:
                         modifier=self.vector_config.sparse_modifier
                     ),
                 },
+                quantization_config=self.vector_config.quantization_config,
             )
             logger.info(f"Created collection {collection_name}")
         except Exception as e:
@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 import time
 import uuid
 import logging
@@ -59,7 +59,7 @@ def transform_sparse(embedding: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
 def extract_object(text: str) -> ForumObject:
     """Extract and parse forum object from JSON text."""
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         return ForumObject(
             summary=data.get("Summary", ""),
             possible_qa=[
@@ -86,7 +86,7 @@ def extract_object(text: str) -> ForumObject:
                 for qa in data.get("PossibleQA", [])
             ],
         )
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Failed to parse JSON, returning empty forum object")
         return ForumObject(summary="", possible_qa=[])
 
@@ -94,7 +94,7 @@ def extract_object(text: str) -> ForumObject:
 def extract_object(text: str) -> ForumObject:
     """Extract and parse tutorial object from JSON text."""
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         groups = []
         for group in data.get("Groups", []):
             qa_objects = []
@@ -129,7 +129,7 @@ def extract_object(text: str) -> ForumObject:
                 GroupObject(summary=group.get("Summary", ""), possible_qa=qa_objects)
             )
         return ForumObject(groups=groups)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Failed to parse JSON, returning empty tutorial object")
         return ForumObject(groups=[])
 
@@ -191,7 +191,7 @@ def start_initialize_forum_qa(context: EtlRagContext) -> None:
     forum_file_path = f"{root_path}/das/.temp/forum/qa/{product}/combined.json"
     folder_path = f"{root_path}/etl_forum_qa/.temp/outputs_embedding/{product}"
 
-    thread_list = json.loads(read_text_from_file(forum_file_path))['threads']
+    thread_list = orjson.loads(read_text_from_file(forum_file_path))['threads']
     thread_dict = {
         f"{thread['tid']}_{thread['postDate']}": thread 
         for thread in thread_list 
@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 import uuid
 import logging
 from dataclasses import dataclass
@@ -58,7 +58,7 @@ def transform_sparse(embedding: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
 def extract_object(text: str) -> TutorialObject:
     """Extract and parse tutorial object from JSON text."""
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         groups = []
         for group in data.get("Groups", []):
             qa_objects = []
@@ -93,7 +93,7 @@ def extract_object(text: str) -> TutorialObject:
                 GroupObject(summary=group.get("Summary", ""), possible_qa=qa_objects)
             )
         return TutorialObject(groups=groups)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Failed to parse JSON, returning empty tutorial object")
         return TutorialObject(groups=[])
 
@@ -155,7 +155,7 @@ def start_initialize_forum_tutorial(context: EtlRagContext) -> None:
     forum_file_path = f"{root_path}/das/.temp/forum/tutorial/{product}/combined.json"
     folder_path = f"{root_path}/etl_forum_tutorial/.temp/outputs_embedding/{product}"
 
-    thread_list = json.loads(read_text_from_file(forum_file_path))['threads']
+    thread_list = orjson.loads(read_text_from_file(forum_file_path))['threads']
     thread_dict = {
         f"{thread['tid']}_{thread['postDate']}": thread for thread in thread_list
     }
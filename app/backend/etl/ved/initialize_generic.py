@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 import uuid
 import logging
 from dataclasses import dataclass
@@ -52,7 +52,7 @@ def transform_sparse(embedding: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
 
 def extract_object(text: str) -> DocumentObject:
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         return DocumentObject(
             product=data.get("Product", ""),
             url=data.get("Url", ""),
@@ -93,7 +93,7 @@ def extract_object(text: str) -> DocumentObject:
                 for group in data.get("Groups", [])
             ],
         )
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Failed to parse JSON, returning empty document object")
         return DocumentObject(groups=[GroupObject(summary="", possible_qa=[])])
 
@@ -55,9 +55,24 @@ class Database:
     def __init__(self):
         """Initialize database connection parameters."""
         try:
-            self.engine = create_engine(app_config.db.connection_string)
+            # Size the pool for concurrent background writes and verify
+            # checkouts so MySQL's idle timeout cannot hand out dead
+            # connections
+            self.engine = create_engine(
+                app_config.db.connection_string,
+                pool_size=10,
+                max_overflow=20,
+                pool_recycle=3600,
+                pool_pre_ping=True,
+            )
+            # expire_on_commit would mark every loaded object stale at the
+            # commit in get_session, turning any later attribute access
+            # into a fresh SELECT on a closed session
             self.SessionLocal = sessionmaker(
-                autocommit=False, autoflush=False, bind=self.engine
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                bind=self.engine,
             )
 
             # Create all tables
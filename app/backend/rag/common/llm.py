@@ -1,4 +1,63 @@
-import json
+import asyncio
+import time
+
+import orjson
+
+# Flush thresholds for buffered streaming
+BUFFER_MAX_CHARS = 8192
+BUFFER_MAX_DELAY = 0.025
+
+
+async def buffered_stream(
+    result_gen, max_chars=BUFFER_MAX_CHARS, max_delay=BUFFER_MAX_DELAY
+):
+    """Aggregate small chunks from an async generator before yielding.
+
+    LLM streams emit one token per chunk; forwarding every token as its
+    own SSE frame spends more time on framing than on payload. Buffer
+    chunks until max_chars is reached or max_delay seconds have passed
+    since the first buffered chunk, then yield the joined text.
+
+    :param result_gen: The async generator producing text chunks.
+    :param max_chars: Flush once the buffered text reaches this size.
+    :param max_delay: Flush after this many seconds even if the buffer is small.
+    """
+    parts = []
+    size = 0
+    deadline = 0.0
+    gen = result_gen.__aiter__()
+    next_task = None
+    try:
+        while True:
+            if next_task is None:
+                next_task = asyncio.ensure_future(gen.__anext__())
+            timeout = None if not parts else max(deadline - time.monotonic(), 0.0)
+            done, _ = await asyncio.wait({next_task}, timeout=timeout)
+            if not done:
+                # Timer expired while the next chunk is still pending
+                yield "".join(parts)
+                parts = []
+                size = 0
+                continue
+            try:
+                text = next_task.result()
+            except StopAsyncIteration:
+                next_task = None
+                break
+            next_task = None
+            if not parts:
+                deadline = time.monotonic() + max_delay
+            parts.append(text)
+            size += len(text)
+            if size >= max_chars:
+                yield "".join(parts)
+                parts = []
+                size = 0
+        if parts:
+            yield "".join(parts)
+    finally:
+        if next_task is not None:
+            next_task.cancel()
 
 
 async def get_llm_full_result(chat_method, *args, **kwargs):
@@ -13,11 +72,11 @@ async def get_llm_full_result(chat_method, *args, **kwargs):
 
     async def wrapper():
         result_gen = await chat_method(*args, **kwargs)
-        result = ""
+        parts = []
 
         async for text in result_gen:
-            result += text
-        return result
+            parts.append(text)
+        return "".join(parts)
 
     return await wrapper()
 
@@ -26,9 +85,9 @@ async def get_llm_sse_result(chat_method, *args, **kwargs):
     async def wrapper():
         result_gen = await chat_method(*args, **kwargs)
 
-        async for text in result_gen:
-            # Format the text as SSE compliant JSON
-            sse_message = f"data: {json.dumps({'text': text}, ensure_ascii=False)}\n\n"
-            yield sse_message
+        async for text in buffered_stream(result_gen):
+            # Format the text as an SSE compliant JSON frame; orjson emits
+            # UTF-8 bytes directly, which StreamingResponse passes through
+            yield b"data: " + orjson.dumps({"text": text}) + b"\n\n"
 
     return wrapper()
@@ -0,0 +1,13 @@
+from functools import lru_cache
+from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=8)
+def get_client(api_base: str, api_key: str) -> AsyncOpenAI:
+    """Return a shared AsyncOpenAI client for the given endpoint.
+
+    The summary/think/query/research services frequently point at the
+    same endpoint; memoizing by (api_base, api_key) lets them share one
+    HTTP connection pool instead of each opening its own.
+    """
+    return AsyncOpenAI(api_key=api_key, base_url=api_base)
@@ -0,0 +1,12 @@
+from typing import Any
+import orjson
+
+
+def dumps_hits(hits: Any) -> str:
+    """Serialize search hits to a JSON string using orjson.
+
+    orjson is much faster than the stdlib json module for the nested
+    payload dicts carried by search hits; the default hook covers the
+    client model objects that stdlib handled via default=vars.
+    """
+    return orjson.dumps(hits, default=lambda o: vars(o)).decode()
@@ -4,6 +4,7 @@ from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import BackgroundTasks
 from qdrant_client import QdrantClient
+import asyncio
 import logging
 import time
 from typing import Dict, Any, Optional
@@ -39,6 +40,7 @@ PRODUCTS_CACHE_TTL = 10  # Cache for 10 seconds
 _products_cache: Dict[
     str, Dict[str, Any]
 ] = {}  # {mode: {data: result, timestamp: time}}
+_products_refreshing: set = set()  # modes with a background refresh in flight
 
 
 class SearchModel(BaseModel):
@@ -153,7 +155,7 @@ async def chat_streaming(item: ChatModel):
 
     logger.info(f"Keyword: {keyword}")
 
-    hits = search_sementic_hybrid(client, keyword, item.product)
+    hits = await asyncio.to_thread(search_sementic_hybrid, client, keyword, item.product)
     stream = await get_llm_sse_result(summary_hits, keyword, item.messages, hits)
     return StreamingResponse(stream, media_type="text/event-stream")
 
@@ -179,7 +181,7 @@ async def think_streaming(item: ChatModel):
 
     logger.info(f"Keyword: {keyword}")
 
-    hits = search_sementic_hybrid(client, keyword, item.product)
+    hits = await asyncio.to_thread(search_sementic_hybrid, client, keyword, item.product)
     stream = await get_llm_sse_result(summary_hits_think, keyword, item.messages, hits)
     return StreamingResponse(stream, media_type="text/event-stream")
 
@@ -205,7 +207,7 @@ async def reasearch_streaming(item: ChatModel):
 
     logger.info(f"Keyword: {keyword}")
 
-    hits = search_sementic_hybrid(client, keyword, item.product)
+    hits = await asyncio.to_thread(search_sementic_hybrid, client, keyword, item.product)
     stream = await get_llm_sse_result(
         research_hits, client, keyword, item.messages, hits, item.product
     )
@@ -296,6 +298,8 @@ def _update_products_cache_background(mode: str) -> None:
         logger.error(
             f"Background product cache update failed, mode: {mode}, error: {e}"
         )
+    finally:
+        _products_refreshing.discard(mode)
 
 
 @app.get("/products/")
@@ -307,8 +311,10 @@ def get_products(mode: str = "fixed", background_tasks: BackgroundTasks = None):
     if cached_result is not None:
         # Have cached data, check if expired
         if _is_cache_expired(mode):
-            # Cache expired, start background task to update
-            if background_tasks:
+            # Cache expired, start background task to update unless one is
+            # already refreshing this mode
+            if background_tasks and mode not in _products_refreshing:
+                _products_refreshing.add(mode)
                 background_tasks.add_task(_update_products_cache_background, mode)
                 logger.info(
                     f"Started background task to update expired cache, mode: {mode}"
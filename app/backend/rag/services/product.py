@@ -27,6 +27,32 @@ FIXED_PRODUCTS = {
     },
 }
 
+# FIXED_PRODUCTS is static, so the fixed-mode response can be built once
+_FIXED_RESPONSE = {
+    "mode": "fixed",
+    "products": [
+        {
+            "id": product_id,
+            "name": product_info["name"],
+            "display_name": product_info["display_name"],
+            "type": "fixed",
+        }
+        for product_id, product_info in FIXED_PRODUCTS.items()
+    ],
+}
+
+
+# Shared vector database client; QdrantClient keeps an HTTP connection
+# pool, so reuse one instance instead of rebuilding it per call
+_vector_client = None
+
+
+def _get_vector_client() -> QdrantClient:
+    global _vector_client
+    if _vector_client is None:
+        _vector_client = QdrantClient(app_config.vector_db.host)
+    return _vector_client
+
 
 def get_generic_products() -> List[Dict]:
     """
@@ -34,9 +60,7 @@ def get_generic_products() -> List[Dict]:
     This can be obtained from database, configuration files or other data sources
     """
     try:
-        # Initialize vector database client
-        url = app_config.vector_db.host
-        client = QdrantClient(url)
+        client = _get_vector_client()
 
         # Get all collections
         response = client.get_aliases()
@@ -84,29 +108,9 @@ def get_available_products(mode: str = "fixed") -> Dict:
             return {"mode": "generic", "products": products}
         else:
             # Fixed product mode
-            products = [
-                {
-                    "id": product_id,
-                    "name": product_info["name"],
-                    "display_name": product_info["display_name"],
-                    "type": "fixed",
-                }
-                for product_id, product_info in FIXED_PRODUCTS.items()
-            ]
-
-            return {"mode": "fixed", "products": products}
+            return _FIXED_RESPONSE
 
     except Exception as e:
         logger.error(f"Error getting available products: {e}")
         # Return fixed product list when error occurs
-        products = [
-            {
-                "id": product_id,
-                "name": product_info["name"],
-                "display_name": product_info["display_name"],
-                "type": "fixed",
-            }
-            for product_id, product_info in FIXED_PRODUCTS.items()
-        ]
-
-        return {"mode": "fixed", "products": products}
+        return _FIXED_RESPONSE
@@ -1,10 +1,7 @@
-from openai import AsyncOpenAI
 from rag.common.config import app_config
+from rag.common.openai_clients import get_client
 
-client = AsyncOpenAI(
-    api_key=app_config.llm_query.api_key,
-    base_url=app_config.llm_query.api_base,
-)
+client = get_client(app_config.llm_query.api_base, app_config.llm_query.api_key)
 model_name = app_config.llm_query.model_name
 
 
@@ -1,20 +1,20 @@
 import asyncio
-import json
 import re
 import logging
-from openai import AsyncOpenAI
+import orjson
 from rag.common.llm import get_llm_full_result
 from rag.services.summary import summary_hits
-from rag.services.search import search_sementic_hybrid
+from rag.services.search import search_sementic_hybrid, get_embedding_pairs
 from rag.services.think import summary_hits_think
 from rag.common.config import app_config
+from rag.common.openai_clients import get_client
+from rag.common.serialize import dumps_hits
 
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(
-    api_key=app_config.llm_research.api_key,
-    base_url=app_config.llm_research.api_base,
-)
+_JSON_BLOCK_PATTERN = re.compile(r"```json(.*?)```", re.DOTALL)
+
+client = get_client(app_config.llm_research.api_base, app_config.llm_research.api_key)
 model_name = app_config.llm_research.model_name
 
 
@@ -33,8 +33,9 @@ async def chat(messages):
             yield text
 
 
-async def split_questions(keyword, messages, hits):
-    hits_text = json.dumps(hits, ensure_ascii=False, default=vars)
+async def split_questions(keyword, messages, hits, hits_text=None):
+    if hits_text is None:
+        hits_text = dumps_hits(hits)
 
     hits_prompt = f"""请综合参考上下文以及下面的用户问题和知识库检索结果，把用户的问题拆解为若干个子问题，输出子问题列表，输出为JSON格式。
 ## 输出格式
@@ -57,10 +58,11 @@ async def split_questions(keyword, messages, hits):
     ] + messages
 
     messages_with_hits[-1]["content"] = hits_prompt
-    logger.debug(
-        "summary_hits words: "
-        + str(len(json.dumps(messages_with_hits, ensure_ascii=False, default=vars)))
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "summary_hits chars: %d",
+            sum(len(m.get("content") or "") for m in messages_with_hits),
+        )
     return chat(messages_with_hits)
 
 
@@ -69,16 +71,42 @@ async def research_hits(client, keyword, messages, hits, product):
 
     # hits = search_sementic_hybrid(client, keyword, product)
 
+    # Serialize hits once and reuse for both prompts below
+    hits_text = dumps_hits(hits)
+
     # Generate questions
-    questions_str = await get_llm_full_result(split_questions, keyword, messages, hits)
-    questions = json.loads(extract_json_content(questions_str))
+    questions_str = await get_llm_full_result(
+        split_questions, keyword, messages, hits, hits_text
+    )
+    questions = orjson.loads(extract_json_content(questions_str))
     logger.debug(f"Generated sub-questions: {questions}")
 
+    # Embed all sub questions in one batched call instead of one call per
+    # search; off the event loop since dashscope's client is synchronous.
+    # With no sub-questions there is nothing to embed or research and the
+    # final summary below still runs.
+    if isinstance(questions, list) and questions:
+        try:
+            embeddings = await asyncio.to_thread(get_embedding_pairs, questions)
+        except Exception as e:
+            logger.error(f"Error embedding sub-questions: {e}")
+            embeddings = []
+    else:
+        questions, embeddings = [], []
+
+    # Align embeddings to questions via text_index rather than response
+    # order; sub-questions without one degrade to zero hits
+    pairs = [{"embedding": [], "sparse_embedding": []} for _ in questions]
+    for embedding_item in embeddings:
+        pairs[embedding_item["text_index"]] = embedding_item
+
     # Process sub question
-    async def process_sub_question(sub_question):
+    async def process_sub_question(sub_question, pair):
         logger.debug(f"Processing sub-question: {sub_question}")
 
-        sub_hits = search_sementic_hybrid(client, sub_question, product)
+        sub_hits = await asyncio.to_thread(
+            search_sementic_hybrid, client, sub_question, product, pair
+        )
         sub_answer = await get_llm_full_result(
             summary_hits, sub_question, messages, sub_hits
         )
@@ -86,7 +114,10 @@ async def research_hits(client, keyword, messages, hits, product):
 
     # Parallel execute
     sub_answers = {}
-    tasks = [process_sub_question(sub_question) for sub_question in questions]
+    tasks = [
+        process_sub_question(sub_question, pair)
+        for sub_question, pair in zip(questions, pairs)
+    ]
     results = await asyncio.gather(*tasks)
 
     # Merge answers
@@ -96,12 +127,11 @@ async def research_hits(client, keyword, messages, hits, product):
         messages.insert(-1, {"role": "assistant", "content": sub_answer})
 
     # Summary the final answer
-    return await summary_hits_think(keyword, messages, hits)
+    return await summary_hits_think(keyword, messages, hits, hits_text)
 
 
 def extract_json_content(text):
-    pattern = r"```json(.*?)```"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _JSON_BLOCK_PATTERN.search(text)
 
     if match:
         return match.group(1)
@@ -1,14 +1,32 @@
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from http import HTTPStatus
 from qdrant_client import QdrantClient, models
 import logging
 
+from rag.common.config import app_config
 from rag.common.embedding import create_embedding
 from rag.services.product import get_generic_products
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Search quantized dense vectors with rescoring against the originals
+_DENSE_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+# Upper bound on merged hits returned to callers; generic mode can collect
+# 8 hits from each of a dozen or more collections
+MAX_TOTAL_HITS = 32
+
+# Shared pool for fanning one query out to many collections concurrently
+_search_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="search")
+
+# Collection categories searched for every product
+SEARCH_CATEGORIES = ("doc", "forum_qa", "forum_tutorial")
+
 collection_name_map = {
     "doc": {
         "forguncy": "doc_forguncy_prod",
@@ -38,13 +56,49 @@ def transform_sparse(embedding):
     }
 
 
-def get_embedding_pair(inputs: List):
+def get_embedding_pairs(inputs: List):
     resp = create_embedding(inputs)
 
     if resp.status_code == HTTPStatus.OK:
-        return resp.output["embeddings"][0]
+        return resp.output["embeddings"]
     else:
-        return {"embedding": [], "sparse_embedding": []}
+        return [{"embedding": [], "sparse_embedding": []} for _ in inputs]
+
+
+def get_embedding_pair(inputs: List):
+    return get_embedding_pairs(inputs)[0]
+
+
+def build_prefetch(pair):
+    """Build the hybrid prefetch list for one query embedding pair.
+
+    Constructed once per query and reused for every collection searched,
+    instead of rebuilding identical SparseVector/Prefetch objects per
+    collection.
+    """
+    dense = pair["embedding"]
+    sparse = transform_sparse(pair["sparse_embedding"])
+    sparse_vector = models.SparseVector(
+        indices=sparse["indices"], values=sparse["values"]
+    )
+    return [
+        models.Prefetch(
+            query=dense,
+            using="question_dense",
+            limit=40,
+            score_threshold=0.4,
+            params=_DENSE_SEARCH_PARAMS,
+        ),
+        models.Prefetch(
+            query=dense,
+            using="answer_dense",
+            limit=40,
+            score_threshold=0.4,
+            params=_DENSE_SEARCH_PARAMS,
+        ),
+        models.Prefetch(query=sparse_vector, using="question_sparse", limit=40),
+        models.Prefetch(query=sparse_vector, using="answer_sparse", limit=40),
+    ]
 
 
 def distinct_clean_search_hits(hits):
@@ -53,11 +107,9 @@ def distinct_clean_search_hits(hits):
 
     for hit in hits:
         key = (
-            str(hit.payload["file_index"])
-            + "_"
-            + str(hit.payload.get("group_index", "_"))
-            + "_"
-            + str(hit.payload["question_index"])
+            hit.payload["file_index"],
+            hit.payload.get("group_index"),
+            hit.payload["question_index"],
         )
         if key not in seen_ids:
             seen_ids.add(key)
@@ -70,101 +122,95 @@ def distinct_clean_search_hits(hits):
     return unique_data
 
 
-def search_sementic_hybrid(client: QdrantClient, query, product):
-    all_hits = []
+def build_search_jobs(product):
+    """Build (collection_name, extra_payload) jobs for one search request."""
+    jobs = []
 
     if product == "generic":
         generic_products = get_generic_products()
         products_to_search = [prod["id"] for prod in generic_products]
-        
+
         # TODO 如果没有获取到动态产品列表，使用固定列表作为fallback
         if not products_to_search:
             products_to_search = ["test1", "test2", "test3", "test4"]
             logger.warning("Failed to get dynamic product list, using fallback list")
-        
+
         logger.info(f"Searching across knowledge bases: {products_to_search}")
-        
+
         for prod in products_to_search:
-            categories = ["doc", "forum_qa", "forum_tutorial"]
-            for category in categories:
-                try:
-                    collection_name = collection_name_map[category].get(prod, "")
-                    if collection_name:  #
-                        hits = search_sementic_hybrid_single(client, query, collection_name)
-                        for hit in hits:
-                            hit.payload["collection_category"] = category
-                            hit.payload["product"] = prod
-                        all_hits += hits
-                except Exception as e:
-                    logger.error(f"Error searching {category} {prod}: {e}")
-
-            try:
-                hits = search_sementic_hybrid_single(client, query, f"generic_{prod}_prod")
-                for hit in hits:
-                    hit.payload["collection_category"] = "generic"
-                    hit.payload["product"] = prod
-                all_hits += hits
-            except Exception as e:
-                logger.error(f"Error searching generic {prod}: {e}")
-    else:
-        categories = ["doc", "forum_qa", "forum_tutorial"]
-        for category in categories:
-            try:
-                collection_name = collection_name_map[category].get(product, "")
+            for category in SEARCH_CATEGORIES:
+                collection_name = collection_name_map[category].get(prod, "")
                 if collection_name:
-                    hits = search_sementic_hybrid_single(client, query, collection_name)
-                    for hit in hits:
-                        hit.payload["collection_category"] = category
-                    all_hits += hits
-            except Exception as e:
-                logger.error(f"Error searching {category} {product}: {e}")
+                    jobs.append(
+                        (
+                            collection_name,
+                            {"collection_category": category, "product": prod},
+                        )
+                    )
+            jobs.append(
+                (
+                    f"generic_{prod}_prod",
+                    {"collection_category": "generic", "product": prod},
+                )
+            )
+    else:
+        for category in SEARCH_CATEGORIES:
+            collection_name = collection_name_map[category].get(product, "")
+            if collection_name:
+                jobs.append((collection_name, {"collection_category": category}))
+        jobs.append((f"generic_{product}_prod", {"collection_category": "generic"}))
+
+    return jobs
+
+
+def search_sementic_hybrid(client: QdrantClient, query, product, pair=None):
+    all_hits = []
 
+    # Embed the query once and reuse the prefetch list for every collection.
+    # Before the embedding was hoisted out of the per-collection loop, a
+    # failure here was caught per collection and the search degraded to
+    # zero hits; keep that behavior for the one-time call.
+    if pair is None:
         try:
-            hits = search_sementic_hybrid_single(client, query, f"generic_{product}_prod")
+            pair = get_embedding_pair([query])
+        except Exception as e:
+            logger.error(f"Error embedding query: {e}")
+            return []
+    prefetch = build_prefetch(pair)
+
+    def run_job(job):
+        collection_name, extra_payload = job
+        try:
+            hits = search_sementic_hybrid_single(client, query, collection_name, prefetch)
             for hit in hits:
-                hit.payload["collection_category"] = "generic"
-            all_hits += hits
+                hit.payload.update(extra_payload)
+            return hits
         except Exception as e:
-            logger.error(f"Error searching generic {product}: {e}")
-    
-    from rag.common.config import app_config
+            logger.error(f"Error searching {collection_name}: {e}")
+            return []
+
+    # The per-collection queries are independent network calls; fan them
+    # out on the shared pool instead of paying one round-trip at a time
+    for hits in _search_pool.map(run_job, build_search_jobs(product)):
+        all_hits += hits
+
     # Fix URL - convert relative paths to full URLs
+    prefix = app_config.url_location
     for hit in all_hits:
-        if 'url' in hit.payload and hit.payload['url'].startswith('/'):
-            hit.payload['url'] = f"{app_config.url_location}{hit.payload['url']}"
-    
-    return sorted(all_hits, key=lambda x: x.score, reverse=True)
+        url = hit.payload.get("url")
+        if url and url[:1] == "/":
+            hit.payload["url"] = prefix + url
 
+    return heapq.nlargest(MAX_TOTAL_HITS, all_hits, key=lambda x: x.score)
 
-def search_sementic_hybrid_single(client: QdrantClient, query, collection):
-    pair = get_embedding_pair([query])
-    dense = pair["embedding"]
-    sparse = transform_sparse(pair["sparse_embedding"])
+
+def search_sementic_hybrid_single(client: QdrantClient, query, collection, prefetch=None):
+    if prefetch is None:
+        prefetch = build_prefetch(get_embedding_pair([query]))
 
     result = client.query_points(
         collection_name=collection,
-        prefetch=[
-            models.Prefetch(
-                query=dense, using="question_dense", limit=40, score_threshold=0.4
-            ),
-            models.Prefetch(
-                query=dense, using="answer_dense", limit=40, score_threshold=0.4
-            ),
-            models.Prefetch(
-                query=models.SparseVector(
-                    indices=sparse["indices"], values=sparse["values"]
-                ),
-                using="question_sparse",
-                limit=40,
-            ),
-            models.Prefetch(
-                query=models.SparseVector(
-                    indices=sparse["indices"], values=sparse["values"]
-                ),
-                using="answer_sparse",
-                limit=40,
-            ),
-        ],
+        prefetch=prefetch,
         query=models.FusionQuery(fusion=models.Fusion.RRF),
         limit=8,
         score_threshold=0.4,
@@ -1,14 +1,11 @@
-import json
 import logging
-from openai import AsyncOpenAI
 from rag.common.config import app_config
+from rag.common.openai_clients import get_client
+from rag.common.serialize import dumps_hits
 
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(
-    api_key=app_config.llm_summary.api_key,
-    base_url=app_config.llm_summary.api_base,
-)
+client = get_client(app_config.llm_summary.api_base, app_config.llm_summary.api_key)
 model_name = app_config.llm_summary.model_name
 
 
@@ -27,8 +24,9 @@ async def chat(messages):
             yield text
 
 
-async def summary_hits(keyword, messages, hits):
-    hits_text = json.dumps(hits, ensure_ascii=False, default=vars)
+async def summary_hits(keyword, messages, hits, hits_text=None):
+    if hits_text is None:
+        hits_text = dumps_hits(hits)
 
     hits_prompt = f"""你正在和用户对话，请综合参考上下文以及下面的用户问题和知识库检索结果，回答用户的问题。回答时附上文档链接。
 ## 用户问题
@@ -46,8 +44,9 @@ async def summary_hits(keyword, messages, hits):
     ] + messages
 
     messages_with_hits[-1]["content"] = hits_prompt
-    logger.info(
-        "summary_hits words: "
-        + str(len(json.dumps(messages_with_hits, ensure_ascii=False, default=vars)))
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "summary_hits chars: %d",
+            sum(len(m.get("content") or "") for m in messages_with_hits),
+        )
     return chat(messages_with_hits)
@@ -1,15 +1,12 @@
-import json
 import logging
-from openai import AsyncOpenAI
 from rag.common.config import app_config
+from rag.common.openai_clients import get_client
+from rag.common.serialize import dumps_hits
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(
-    api_key=app_config.llm_think.api_key,
-    base_url=app_config.llm_think.api_base,
-)
+client = get_client(app_config.llm_think.api_base, app_config.llm_think.api_key)
 model_name = app_config.llm_think.model_name
 
 
@@ -24,14 +21,15 @@ async def think(messages):
     content_started = False
 
     async for chunk in completion:
-        reasoning_content = chunk.choices[0].delta.reasoning_content
+        delta = chunk.choices[0].delta
+        reasoning_content = delta.reasoning_content
         if reasoning_content is not None and len(reasoning_content):
             if not think_started:
                 yield "> "
                 think_started = True
             yield reasoning_content.replace("\n", "\n> ")
 
-        content = chunk.choices[0].delta.content
+        content = delta.content
         if content is not None and len(content):
             if not content_started:
                 yield "\r\n---\r\n"
@@ -39,8 +37,9 @@ async def think(messages):
             yield content
 
 
-async def summary_hits_think(keyword, messages, hits):
-    hits_text = json.dumps(hits, ensure_ascii=False, default=vars)
+async def summary_hits_think(keyword, messages, hits, hits_text=None):
+    if hits_text is None:
+        hits_text = dumps_hits(hits)
 
     hits_prompt = f"""你正在和用户对话，请综合参考上下文以及下面的用户问题和知识库检索结果，回答用户的问题。回答时附上文档链接。
 ## 用户问题
@@ -59,8 +58,9 @@ async def summary_hits_think(keyword, messages, hits):
     ] + messages
 
     messages_with_hits[-1]["content"] = hits_prompt
-    logger.debug(
-        "summary_hits words: "
-        + str(len(json.dumps(messages_with_hits, ensure_ascii=False, default=vars)))
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "summary_hits chars: %d",
+            sum(len(m.get("content") or "") for m in messages_with_hits),
+        )
     return think(messages_with_hits)